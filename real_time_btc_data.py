@@ -1,20 +1,295 @@
+import asyncio
+import collections
+import gc
+import os
+import queue
+import random
+import sqlite3
+import sys
+import threading
+import time
 from abc import abstractmethod, ABC
-from datetime import datetime
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, NamedTuple, TYPE_CHECKING
 
+import aiohttp
 import ccxt
-import pandas as pd
-from ccxt import binance, Exchange
+import numpy as np
+import orjson
+import requests
+from ccxt import binance, Exchange, pro
+from numba import njit
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
+# transient errors, worth retrying: the exchange is unreachable, unavailable, or rate-limits us
+_RETRYABLE_ERRORS: tuple = (ccxt.NetworkError, ccxt.ExchangeNotAvailable, ccxt.RateLimitExceeded)
+
+
+class NoDataError(ccxt.ExchangeError):
+    """
+    Raised when the exchange kept returning no data, although the call succeeded
+    """
+    pass
+
+
+def _backoff_delay(attempt: int, base: float = 0.2, cap: float = 5.0) -> float:
+    """
+    Capped exponential backoff, with jitter so that retries do not all happen at the same time
+    :param attempt: Number of attempts already failed, minus one
+    :param base: Delay of the first retry, in seconds
+    :param cap: Maximum delay, in seconds (jitter excluded)
+    :return: the delay to wait before next attempt, in seconds
+    """
+    # the exponent is bounded so that long outages do not overflow the float conversion
+    return min(cap, base * 2 ** min(attempt, 16)) + random.random() * base
+
+
+def _retry(fn: Callable[[], list], *, base: float = 0.2, cap: float = 5.0, tries: int = 8) -> list:
+    """
+    Call fn until it returns a non-empty result, waiting between attempts.
+    Only transient exchange errors are retried, other errors are raised.
+    :param fn: the call to retry
+    :param base: Delay of the first retry, in seconds
+    :param cap: Maximum delay between attempts, in seconds (jitter excluded)
+    :param tries: Maximum number of attempts
+    :return: the result of fn
+    """
+    for attempt in range(tries):
+        try:
+            result: list = fn()
+            if len(result) > 0:
+                return result
+        except _RETRYABLE_ERRORS:
+            if attempt == tries - 1:
+                raise
+
+        if attempt < tries - 1:
+            time.sleep(_backoff_delay(attempt=attempt, base=base, cap=cap))
+
+    raise NoDataError(f'exchange returned no data after {tries} tries')
+
+
+async def _retry_async(fn: Callable[[], Awaitable[list]], *, base: float = 0.2, cap: float = 5.0, tries: int = 8) -> list:
+    """
+    Asynchronous version of _retry: await fn until it returns a non-empty result, waiting between attempts.
+    Only transient exchange errors are retried, other errors are raised.
+    :param fn: the call to retry
+    :param base: Delay of the first retry, in seconds
+    :param cap: Maximum delay between attempts, in seconds (jitter excluded)
+    :param tries: Maximum number of attempts
+    :return: the result of fn
+    """
+    for attempt in range(tries):
+        try:
+            result: list = await fn()
+            if len(result) > 0:
+                return result
+        except _RETRYABLE_ERRORS:
+            if attempt == tries - 1:
+                raise
+
+        if attempt < tries - 1:
+            await asyncio.sleep(_backoff_delay(attempt=attempt, base=base, cap=cap))
+
+    raise NoDataError(f'exchange returned no data after {tries} tries')
+
+
+# indexes in the state array of _update_rolling. Candles are numbered in order of arrival,
+# candle n being stored in slot n % ring size; the queues keep candle numbers
+_OLDEST: int = 0   # number of the oldest candle of the window
+_NEXT: int = 1     # number of the next candle
+_HI_HEAD: int = 2  # positions of first and next element of the decreasing highs queue
+_HI_TAIL: int = 3
+_LO_HEAD: int = 4  # positions of first and next element of the increasing lows queue
+_LO_TAIL: int = 5
+
+
+@njit(cache=True)
+def _update_rolling(ring_ts: np.ndarray, ring_h: np.ndarray, ring_l: np.ndarray, ring_v: np.ndarray,
+                    hi_queue: np.ndarray, lo_queue: np.ndarray, state: np.ndarray, vsum: float,
+                    new_ts: int, new_h: float, new_l: float, new_v: float, window: int) -> tuple[float, float, float]:
+    """
+    Add a candle to the rolling window stored in ring buffers, the candles older than the window leaving it.
+    High and low are read from monotonic queues (decreasing highs, increasing lows) and the volume is a running sum,
+    so that an update is O(1) amortized.
+    :param ring_ts: open times of the candles (in milliseconds)
+    :param ring_h: highs of the candles
+    :param ring_l: lows of the candles
+    :param ring_v: volumes of the candles
+    :param hi_queue: numbers of the candles with decreasing highs, circular queue of the ring size
+    :param lo_queue: numbers of the candles with increasing lows, circular queue of the ring size
+    :param state: positions in the ring and the queues, updated in place (see _OLDEST, _NEXT, ...)
+    :param vsum: summed volume of the window before the update
+    :param new_ts: open time of the candle, in milliseconds
+    :param new_h: high of the candle
+    :param new_l: low of the candle
+    :param new_v: volume of the candle
+    :param window: duration of the window, in milliseconds
+    :return: the highest high, the lowest low, and the summed volume over the window
+    """
+    size = ring_ts.shape[0]
+    number = state[_NEXT]
+
+    # remove candles older than the window, or overwritten by the new one
+    cutoff = new_ts - window
+    while state[_OLDEST] < number and (ring_ts[state[_OLDEST] % size] <= cutoff or number - state[_OLDEST] >= size):
+        vsum -= ring_v[state[_OLDEST] % size]
+        state[_OLDEST] += 1
+    while state[_HI_HEAD] < state[_HI_TAIL] and hi_queue[state[_HI_HEAD] % size] < state[_OLDEST]:
+        state[_HI_HEAD] += 1
+    while state[_LO_HEAD] < state[_LO_TAIL] and lo_queue[state[_LO_HEAD] % size] < state[_OLDEST]:
+        state[_LO_HEAD] += 1
+
+    slot = number % size
+    ring_ts[slot] = new_ts
+    ring_h[slot] = new_h
+    ring_l[slot] = new_l
+    ring_v[slot] = new_v
+    vsum += new_v
+
+    while state[_HI_HEAD] < state[_HI_TAIL] and ring_h[hi_queue[(state[_HI_TAIL] - 1) % size] % size] <= new_h:
+        state[_HI_TAIL] -= 1
+    hi_queue[state[_HI_TAIL] % size] = number
+    state[_HI_TAIL] += 1
+    while state[_LO_HEAD] < state[_LO_TAIL] and ring_l[lo_queue[(state[_LO_TAIL] - 1) % size] % size] >= new_l:
+        state[_LO_TAIL] -= 1
+    lo_queue[state[_LO_TAIL] % size] = number
+    state[_LO_TAIL] += 1
+
+    state[_NEXT] = number + 1
+
+    return ring_h[hi_queue[state[_HI_HEAD] % size] % size], ring_l[lo_queue[state[_LO_HEAD] % size] % size], vsum
+
+
+@njit(cache=True)
+def _sma_update(window: np.ndarray, head: int, new_close: float, running_sum: float) -> tuple[float, int]:
+    """
+    Write a close in a ring buffer in place of the oldest one, and update the running sum of the buffer
+    :param window: closes, 0 for empty slots
+    :param head: index of the oldest close
+    :param new_close: the close to add
+    :param running_sum: sum of the closes before the update
+    :return: the new sum of the closes, and the new index of the oldest close
+    """
+    new_sum = running_sum - window[head] + new_close
+    window[head] = new_close
+
+    return new_sum, (head + 1) % window.shape[0]
+
+
+class Candles(NamedTuple):
+    """
+    Candles of a pair/timeframe, with one array per column, sorted by open time
+    """
+    open_time: np.ndarray  # int64, in milliseconds
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+
+class CandleStore:
+    """
+    Keeps finished candles on disk (SQLite), the most recently used ones being also kept in memory.
+    As a finished candle never changes, it only has to be fetched once on exchange.
+    """
+
+    def __init__(self, path: str = 'candles.sqlite', max_candles_in_memory: int = 4096):
+        """
+        :param path: Path of the SQLite database. Created if it does not exist
+        :param max_candles_in_memory: Number of candles kept in memory, the least recently used ones are evicted first
+        """
+        # the store is used by the thread notifying new candles, not only by the one which created it
+        self.__connection: sqlite3.Connection = sqlite3.connect(path, check_same_thread=False)
+        self.__connection.execute('CREATE TABLE IF NOT EXISTS candles ('
+                                  'symbol TEXT NOT NULL, timeframe TEXT NOT NULL, open_time INTEGER NOT NULL, '
+                                  'open REAL, high REAL, low REAL, close REAL, volume REAL, '
+                                  'PRIMARY KEY (symbol, timeframe, open_time))')
+        self.__connection.commit()
+        self.__max_candles_in_memory: int = max_candles_in_memory
+        self.__candles_in_memory: collections.OrderedDict[tuple[str, str, int], list] = collections.OrderedDict()
+
+    def get_candles(self, spot_symbol: str, timeframe: str, since: int, timeframe_duration: int) -> list:
+        """
+        Returns the stored candles from a defined open time, until a candle is missing
+        :param spot_symbol: The pair. Relative to the exchange
+        :param timeframe: Timeframe. Relative to the exchange
+        :param since: Open time (in milliseconds) of the first candle
+        :param timeframe_duration: Timeframe duration in milliseconds
+        :return: the candles (open_time, open, high, low, close, volume), as returned by the exchange
+        """
+        candles: list = []
+        open_time: int = since
+        while True:
+            key: tuple[str, str, int] = (spot_symbol, timeframe, open_time)
+            if key not in self.__candles_in_memory:
+                # load at once from disk the following candles
+                self.__load(spot_symbol=spot_symbol, timeframe=timeframe, since=open_time)
+                if key not in self.__candles_in_memory:
+                    break
+
+            self.__candles_in_memory.move_to_end(key)
+            candles.append(self.__candles_in_memory[key])
+            open_time += timeframe_duration
+
+        self.__evict()
+        return candles
+
+    def save_candles(self, spot_symbol: str, timeframe: str, candles: list) -> None:
+        """
+        Store finished candles
+        :param spot_symbol: The pair. Relative to the exchange
+        :param timeframe: Timeframe. Relative to the exchange
+        :param candles: finished candles (open_time, open, high, low, close, volume), as returned by the exchange
+        """
+        self.__connection.executemany('INSERT OR REPLACE INTO candles VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                                      [(spot_symbol, timeframe, *candle[:6]) for candle in candles])
+        self.__connection.commit()
+        for candle in candles:
+            self.__candles_in_memory[(spot_symbol, timeframe, int(candle[0]))] = list(candle[:6])
+
+        self.__evict()
+
+    def __load(self, spot_symbol: str, timeframe: str, since: int) -> None:
+        """
+        Load candles from disk into memory, as many as memory can keep
+        """
+        rows = self.__connection.execute('SELECT open_time, open, high, low, close, volume FROM candles '
+                                         'WHERE symbol = ? AND timeframe = ? AND open_time >= ? '
+                                         'ORDER BY open_time LIMIT ?',
+                                         (spot_symbol, timeframe, since, self.__max_candles_in_memory))
+        for row in rows:
+            self.__candles_in_memory[(spot_symbol, timeframe, row[0])] = list(row)
+
+    def __evict(self) -> None:
+        """
+        Remove from memory the least recently used candles exceeding the limit
+        """
+        while len(self.__candles_in_memory) > self.__max_candles_in_memory:
+            self.__candles_in_memory.popitem(last=False)
 
 
 class ExchangeHelper:
     """
-    Permits to fetch candles on exchange easily in a easy-to-use format (DataFrame).
+    Permits to fetch candles on exchange easily in a easy-to-use format (Candles, or DataFrame).
+    Finished candles can be kept in a CandleStore so that they are not fetched again.
     """
 
+    __MAX_CANDLES_PER_REQUEST: int = 1000
+
     @staticmethod
-    def get_spot_dataframe(exchange: Exchange, spot_symbol: str, timeframe: str, number_of_candles: int, delete_last_candle: bool) -> pd.DataFrame:
+    def get_spot_dataframe(exchange: Exchange, spot_symbol: str, timeframe: str, number_of_candles: int, delete_last_candle: bool) -> 'pd.DataFrame':
         """
         Returns a dataframe containing the last available candles on exchange for a defined pair/timeframe.
+        pandas is only imported by this method: prefer get_spot_candles when a DataFrame is not needed.
         :param exchange: Exchange
         :param spot_symbol: The pair. Relative to the exchange
         :param timeframe: Timeframe ('1m', '5m', '15m', '30m', 1h', '2h', '4h', '8h', '12h', '1d', '3d', '1w'). Relative to the exchange
@@ -22,67 +297,168 @@ class ExchangeHelper:
         :param delete_last_candle: Delete last fetched candle. Useful if the exchange always returns as last candle a not finished one
         :return: DataFrame containing candles data: 'open_time', 'open', 'high', 'low', 'close', 'volume'
         """
-        candles: list = []
-        while len(candles) == 0:
-            try:
-                # sometimes exchange returns an empty list or throw an exception,
-                # that's why it's in a for loop and a try-catch for retry purpose
-                candles = exchange.fetch_ohlcv(symbol=spot_symbol, timeframe=timeframe, limit=number_of_candles)
-            except Exception:
-                pass
+        import pandas as pd
+
+        candles: Candles = ExchangeHelper.get_spot_candles(exchange=exchange, spot_symbol=spot_symbol, timeframe=timeframe,
+                                                           number_of_candles=number_of_candles, delete_last_candle=delete_last_candle)
+        df = pd.DataFrame(candles._asdict())
+
+        # cast the timestamp into a human-readable format
+        df['open_time'] = pd.to_datetime(df['open_time'], unit='ms', errors='coerce')
 
-        return ExchangeHelper.__build_dataframe(candles=candles, delete_last_candle=delete_last_candle)
+        return df
 
     @staticmethod
-    def __build_dataframe(candles: list, delete_last_candle: bool) -> pd.DataFrame:
+    def get_spot_candles(exchange: Exchange, spot_symbol: str, timeframe: str, number_of_candles: int, delete_last_candle: bool,
+                         store: CandleStore = None) -> Candles:
         """
-        Convert candles
-        :param candles: the data. Also called 'k-lines' by exchanges.
-        :param delete_last_candle: Delete last candle from result
-        :return: a dataframe containing candles
+        Returns the last available candles on exchange for a defined pair/timeframe, with one array per column.
+        Lighter than a DataFrame when only a few values are read.
+        :param exchange: Exchange
+        :param spot_symbol: The pair. Relative to the exchange
+        :param timeframe: Timeframe ('1m', '5m', '15m', '30m', 1h', '2h', '4h', '8h', '12h', '1d', '3d', '1w'). Relative to the exchange
+        :param number_of_candles: Number of candles
+        :param delete_last_candle: Delete last fetched candle. Useful if the exchange always returns as last candle a not finished one
+        :param store: Store of finished candles. If defined, only the candles which are not stored yet are fetched on exchange
+        :return: Candles containing candles data: open_time (in milliseconds), open, high, low, close, volume
         """
-        df = pd.DataFrame(candles, columns=['open_time', 'open', 'high', 'low', 'close', 'volume'])
+        if store is None:
+            candles: list = ExchangeHelper.__fetch_candles_until_value(exchange=exchange, spot_symbol=spot_symbol,
+                                                                       timeframe=timeframe, number_of_candles=number_of_candles)
+            return ExchangeHelper.__build_candles(candles=candles, delete_last_candle=delete_last_candle)
 
-        # cast the timestamp into a human-readable format
-        df['open_time'] = pd.to_datetime(df['open_time'], unit='ms', errors='coerce')
+        timeframe_duration: int = exchange.parse_timeframe(timeframe) * 1000
+        # the local clock is only used to know from where to read: one more candle is read,
+        # in case it is ahead of the exchange's one, and the result is then cut to the last candles
+        since: int = (exchange.milliseconds() // timeframe_duration - number_of_candles) * timeframe_duration
+        candles: list = ExchangeHelper.__fetch_candles_through_store(exchange=exchange, store=store, spot_symbol=spot_symbol, timeframe=timeframe,
+                                                                     since=since)[-number_of_candles:]
 
-        if delete_last_candle:
-            # drop last row which is not a 'finished' candle (i.e time does not have reached its end time)
-            df.drop(df.tail(1).index, inplace=True)
+        return ExchangeHelper.__build_candles(candles=candles, delete_last_candle=delete_last_candle)
 
-        return df
+    @staticmethod
+    def get_spot_candles_since(exchange: Exchange, spot_symbol: str, timeframe: str, since: int, delete_last_candle: bool,
+                               store: CandleStore = None) -> Candles:
+        """
+        Returns all the available candles on exchange for a defined pair/timeframe since a defined time, with one array per column.
+        Candles are fetched page by page as exchanges limit the number of candles returned per request.
+        :param exchange: Exchange
+        :param spot_symbol: The pair. Relative to the exchange
+        :param timeframe: Timeframe ('1m', '5m', '15m', '30m', 1h', '2h', '4h', '8h', '12h', '1d', '3d', '1w'). Relative to the exchange
+        :param since: Open time (in milliseconds) from which candles are fetched
+        :param delete_last_candle: Delete last fetched candle. Useful if the exchange always returns as last candle a not finished one
+        :param store: Store of finished candles. If defined, only the candles which are not stored yet are fetched on exchange
+        :return: Candles containing candles data: open_time (in milliseconds), open, high, low, close, volume
+        """
+        if store is None:
+            candles: list = ExchangeHelper.__fetch_candles_since(exchange=exchange, spot_symbol=spot_symbol, timeframe=timeframe, since=since)
+            return ExchangeHelper.__build_candles(candles=candles, delete_last_candle=delete_last_candle)
 
+        timeframe_duration: int = exchange.parse_timeframe(timeframe) * 1000
+        # align on the open time of the first candle
+        since = -(-since // timeframe_duration) * timeframe_duration
+        candles: list = ExchangeHelper.__fetch_candles_through_store(exchange=exchange, store=store, spot_symbol=spot_symbol, timeframe=timeframe,
+                                                                     since=since)
 
-class SymbolTimeframe:
-    """
-    A class to represent a pair associated to a timeframe
-    """
+        return ExchangeHelper.__build_candles(candles=candles, delete_last_candle=delete_last_candle)
 
-    def __init__(self, spot_symbol: str, timeframe: str, number_of_candle_per_update: int, must_delete_unfinished_candle: bool):
-        self.__spot_symbol: str = spot_symbol
-        self.__timeframe: str = timeframe
-        self.__number_of_candle_per_update: int = number_of_candle_per_update
-        self.__must_delete_unfinished_candle: bool = must_delete_unfinished_candle
+    @staticmethod
+    def __fetch_candles_through_store(exchange: Exchange, store: CandleStore, spot_symbol: str, timeframe: str, since: int) -> list:
+        """
+        Returns candles from a defined open time until the last one returned by the exchange.
+        Only the candles that are not in store are fetched on exchange, and the fetched finished candles are then stored.
+        As for exchange's results, the last candle may not be finished.
+        :param exchange: Exchange
+        :param store: Store of finished candles
+        :param spot_symbol: The pair. Relative to the exchange
+        :param timeframe: Timeframe. Relative to the exchange
+        :param since: Open time (in milliseconds) of the first candle, aligned on the timeframe
+        :return: the candles, as returned by the exchange
+        """
+        timeframe_duration: int = exchange.parse_timeframe(timeframe) * 1000
+
+        candles: list = store.get_candles(spot_symbol=spot_symbol, timeframe=timeframe, since=since, timeframe_duration=timeframe_duration)
+        last_stored_open_time: int = int(candles[-1][0]) if len(candles) > 0 else since - timeframe_duration
+
+        # the tail is always fetched: the exchange's last candle tells which candles are finished
+        fetched: list = ExchangeHelper.__fetch_candles_since(exchange=exchange, spot_symbol=spot_symbol, timeframe=timeframe,
+                                                             since=last_stored_open_time + timeframe_duration)
+        fetched = [candle for candle in fetched if candle[0] > last_stored_open_time]
+        # only the candles older than the exchange's last one are finished, the last one is never stored
+        store.save_candles(spot_symbol=spot_symbol, timeframe=timeframe, candles=fetched[:-1])
+
+        return candles + fetched
+
+    @staticmethod
+    def __fetch_candles_since(exchange: Exchange, spot_symbol: str, timeframe: str, since: int) -> list:
+        """
+        Fetch page by page all the candles on exchange since a defined time
+        :param exchange: Exchange
+        :param spot_symbol: The pair. Relative to the exchange
+        :param timeframe: Timeframe. Relative to the exchange
+        :param since: Open time (in milliseconds) from which candles are fetched
+        :return: the candles, as returned by the exchange
+        """
+        timeframe_duration: int = exchange.parse_timeframe(timeframe) * 1000
+        candles: list = []
+        while True:
+            page: list = ExchangeHelper.__fetch_candles_until_value(
+                exchange=exchange, spot_symbol=spot_symbol, timeframe=timeframe,
+                number_of_candles=ExchangeHelper.__MAX_CANDLES_PER_REQUEST, since=since)
+            candles += page
+
+            last_open_time: int = int(page[-1][0])
+            # stop once the current (not finished) candle is reached; a short page is not enough, since
+            # some exchanges return fewer candles per request than asked
+            if last_open_time + timeframe_duration > exchange.milliseconds():
+                break
+            since = last_open_time + 1
 
-    def get_spot_symbol(self) -> str:
-        return self.__spot_symbol
+        return candles
+
+    @staticmethod
+    def __fetch_candles_until_value(exchange: Exchange, spot_symbol: str, timeframe: str, number_of_candles: int, since: int = None) -> list:
+        """
+        Fetch candles on exchange, retrying with backoff until the exchange returns some
+        :param exchange: Exchange
+        :param spot_symbol: The pair. Relative to the exchange
+        :param timeframe: Timeframe. Relative to the exchange
+        :param number_of_candles: Number of candles
+        :param since: Open time (in milliseconds) of the first candle. Last candles are fetched if not defined
+        :return: the candles, as returned by the exchange
+        """
+        # sometimes exchange returns an empty list or throw an exception, that's why it's retried
+        return _retry(lambda: exchange.fetch_ohlcv(symbol=spot_symbol, timeframe=timeframe, since=since, limit=number_of_candles))
 
-    def get_timeframe(self) -> str:
-        return self.__timeframe
+    @staticmethod
+    def __build_candles(candles: list, delete_last_candle: bool) -> Candles:
+        """
+        Convert candles, from one list per candle to one array per column
+        :param candles: the data. Also called 'k-lines' by exchanges.
+        :param delete_last_candle: Delete last candle from result
+        :return: Candles containing candles
+        """
+        if delete_last_candle:
+            # drop last candle which is not a 'finished' one (i.e time does not have reached its end time)
+            candles = candles[:-1]
 
-    def get_number_of_candle_per_update(self) -> int:
-        return self.__number_of_candle_per_update
+        count: int = len(candles)
+        prices_and_volume: list[np.ndarray] = [np.fromiter((candle[index] for candle in candles), dtype=np.float64, count=count)
+                                               for index in range(1, 6)]
 
-    def must_delete_unfinished_candle(self) -> bool:
-        return self.__must_delete_unfinished_candle
+        return Candles(np.fromiter((candle[0] for candle in candles), dtype=np.int64, count=count), *prices_and_volume)
 
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, SymbolTimeframe):
-            return False
-        return self.__spot_symbol == other.__spot_symbol and self.__timeframe == other.__timeframe
 
-    def __hash__(self) -> int:
-        return hash((self.__spot_symbol, self.__timeframe))
+@dataclass(frozen=True, slots=True)
+class SymbolTimeframe:
+    """
+    A class to represent a pair associated to a timeframe.
+    Two instances are equal when they have the same pair and timeframe.
+    """
+    spot_symbol: str
+    timeframe: str
+    number_of_candle_per_update: int = field(compare=False)
+    must_delete_unfinished_candle: bool = field(compare=False)
 
 
 class NewCandleListener(ABC):
@@ -98,119 +474,313 @@ class NewCandleListener(ABC):
         pass
 
 
+class BinanceFastClient:
+    """
+    Minimal asynchronous client of the Binance candles REST endpoint.
+    Lighter than ccxt for frequent calls: no market loading nor unified structures, and responses are parsed with orjson.
+    """
+
+    __CANDLES_URL: str = 'https://api.binance.com/api/v3/klines'
+
+    def __init__(self, timeout: float = 5.0):
+        """
+        :param timeout: Maximum duration of a request, in seconds
+        """
+        self.__timeout: aiohttp.ClientTimeout = aiohttp.ClientTimeout(total=timeout)
+        self.__session: aiohttp.ClientSession | None = None
+
+    async def fetch_ohlcv(self, symbol: str, timeframe: str, limit: int) -> list:
+        """
+        Fetch the last candles of a defined pair/timeframe
+        :param symbol: The pair, in ccxt format (e.g. 'BTC/USDT')
+        :param timeframe: Timeframe ('1m', '5m', '15m', '30m', 1h', '2h', '4h', '8h', '12h', '1d', '3d', '1w')
+        :param limit: Number of candles
+        :return: the candles (open_time, open, high, low, close, volume), in the same format as ccxt
+        """
+        if self.__session is None:
+            # the session keeps connections alive between calls; it must be created inside the event loop
+            self.__session = aiohttp.ClientSession(timeout=self.__timeout)
+
+        params: dict = {'symbol': symbol.replace('/', ''), 'interval': timeframe, 'limit': limit}
+        try:
+            async with self.__session.get(self.__CANDLES_URL, params=params) as response:
+                body: bytes = await response.read()
+                status: int = response.status
+        except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+            raise ccxt.NetworkError(str(error)) from error
+
+        if status in (418, 429):
+            raise ccxt.RateLimitExceeded(body.decode(errors='replace'))
+        if status >= 500:
+            raise ccxt.ExchangeNotAvailable(body.decode(errors='replace'))
+        if status != 200:
+            raise ccxt.ExchangeError(body.decode(errors='replace'))
+
+        try:
+            return [[int(k[0]), float(k[1]), float(k[2]), float(k[3]), float(k[4]), float(k[5])] for k in orjson.loads(body)]
+        except (orjson.JSONDecodeError, TypeError, KeyError, IndexError, ValueError) as error:
+            # e.g. a maintenance page or a JSON error object served with a 200 status
+            raise ccxt.ExchangeError(body[:200].decode(errors='replace')) from error
+
+    async def close(self) -> None:
+        """
+        Close opened connections.
+        """
+        if self.__session is not None:
+            await self.__session.close()
+            self.__session = None
+
+
 class NewCandleNotifier:
     """
-    A class that check constantly for new candles for a defined group of pair/timeframe
+    A class that watches constantly for new candles for a defined group of pair/timeframe
     When a new candle is detected, it notifies objects that subscribed to this class.
+    Candles are pushed by the exchange through WebSocket streams. A lightweight REST client is used
+    to get the initial timestamps, and to keep looking for new candles while a stream is unavailable.
+    Subscribers are notified from a dedicated thread, so that their work does not delay the detection of new candles.
     """
 
-    def __init__(self, exchange: binance, symbol_timeframes: list[SymbolTimeframe]):
-        self.__exchange: binance = exchange
+    def __init__(self, exchange: pro.binance, symbol_timeframes: list[SymbolTimeframe]):
+        self.__exchange: pro.binance = exchange
+        self.__fast_client: BinanceFastClient = BinanceFastClient()
         self.__symbol_timeframes: list[SymbolTimeframe] = symbol_timeframes
-        self.__listeners: list = []
+        # bound on_new_candle methods of the subscribers, resolved once at subscription
+        self.__callbacks: tuple[Callable[[SymbolTimeframe], None], ...] = ()
         self.__last_timestamp_per_symbol_timeframe: dict[SymbolTimeframe, int] = {}
         self.__must_run: bool = False
+        self.__events: queue.SimpleQueue = queue.SimpleQueue()
+        self.__dispatch_error: BaseException | None = None
 
     def register_listener(self, listener: NewCandleListener) -> None:
         """
         Subscribe to this class in order to get notified when a new candle is available.
         """
-        self.__listeners.append(listener)
+        # a new tuple is built, so that the dispatcher thread never sees a partially updated one
+        self.__callbacks = (*self.__callbacks, listener.on_new_candle)
 
-    def start(self) -> None:
+    def start(self, cpu_affinity: int | None = None) -> None:
         """
-        Starts looking for new candles on defined group of pair/timeframe.
+        Starts watching for new candles on defined group of pair/timeframe.
         When a new candle is detected, it notifies subscribers.
+        The event loop is run by uvloop when it is available.
+        :param cpu_affinity: CPU to which the process is pinned, to reduce latency jitter. Not pinned if not defined,
+        or if the platform does not support it
         """
+        if cpu_affinity is not None and hasattr(os, 'sched_setaffinity'):
+            # done before starting the dispatcher, which inherits the affinity
+            os.sched_setaffinity(0, {cpu_affinity})
+
         self.__must_run = True
-        self.__last_timestamp_per_symbol_timeframe = self.__get_initial_timestamps()
+        self.__dispatch_error = None
+        dispatcher = threading.Thread(target=self.__dispatch, name='new-candle-dispatcher', daemon=True)
+        dispatcher.start()
+        try:
+            run = uvloop.run if uvloop is not None else asyncio.run
+            run(self.__run())
+        finally:
+            self.__events.put(None)  # wake up the dispatcher so that it ends
+            dispatcher.join()
+
+        if self.__dispatch_error is not None:
+            raise self.__dispatch_error
+
+    def stop(self) -> None:
+        """
+        Stop class's activity (watching for new candles and notifying subscribers).
+        """
+        self.__must_run = False
+
+    async def __run(self) -> None:
+        """
+        Watch concurrently every pair/timeframe until the notifier is stopped.
+        """
+        try:
+            self.__last_timestamp_per_symbol_timeframe = await self.__get_initial_timestamps()
+            watchers = [asyncio.create_task(self.__watch(st)) for st in self.__symbol_timeframes]
+            await asyncio.gather(*watchers)
+        finally:
+            await self.__fast_client.close()
+            await self.__exchange.close()
+
+    async def __watch(self, to_watch: SymbolTimeframe) -> None:
+        """
+        Watch the candles stream of a defined pair/timeframe and notify subscribers when a new candle appears
+        :param to_watch: pair/timeframe to watch
+        """
+        failed_attempts: int = 0
         while self.__must_run:
             try:
-                for st in self.__symbol_timeframes:
-                    old_timestamp: int = self.__last_timestamp_per_symbol_timeframe[st]
-                    timestamp: int = self.__fetch_last_candle_timestamp_until_value(st)
+                candles: list = await self.__exchange.watch_ohlcv(symbol=to_watch.spot_symbol,
+                                                                  timeframe=to_watch.timeframe)
+            except _RETRYABLE_ERRORS:
+                # the stream is re-opened by the next call, meanwhile new candles are looked for through REST
+                await self.__poll(to_watch)
+                await asyncio.sleep(_backoff_delay(attempt=failed_attempts))
+                failed_attempts += 1
+                continue
 
-                    if timestamp > old_timestamp:
-                        self.__last_timestamp_per_symbol_timeframe[st] = timestamp
-                        self.__notify_listeners(st)
+            failed_attempts = 0
 
-            except Exception:
-                pass
+            if len(candles) > 0:
+                self.__check_timestamp(to_check=to_watch, timestamp=int(candles[-1][0]))
 
-    def stop(self) -> None:
+    async def __poll(self, to_poll: SymbolTimeframe) -> None:
         """
-        Stop class's activity (looking for new candles and notifying subscribers).
+        Fetch once through REST the last candle of a defined pair/timeframe, and notify subscribers if it is a new one
+        :param to_poll: pair/timeframe to check for
         """
-        self.__must_run = False
+        try:
+            candle: list = await self.__fast_client.fetch_ohlcv(symbol=to_poll.spot_symbol, timeframe=to_poll.timeframe, limit=1)
+        except _RETRYABLE_ERRORS + (ccxt.ExchangeError,):
+            return
+
+        if len(candle) > 0:
+            self.__check_timestamp(to_check=to_poll, timestamp=int(candle[0][0]))
 
-    def __get_initial_timestamps(self) -> dict[SymbolTimeframe, int]:
+    def __check_timestamp(self, to_check: SymbolTimeframe, timestamp: int) -> None:
+        """
+        Notify subscribers if a timestamp is the one of a new candle
+        :param to_check: pair/timeframe of the candle
+        :param timestamp: open time of the last candle
+        """
+        if self.__must_run and timestamp > self.__last_timestamp_per_symbol_timeframe[to_check]:
+            self.__last_timestamp_per_symbol_timeframe[to_check] = timestamp
+            self.__notify_listeners(to_check)
+
+    async def __get_initial_timestamps(self) -> dict[SymbolTimeframe, int]:
         """
         Return the last candles' timestamps for a defined group of pair/timeframe
         :return: a dictionary associating the symbol/timeframe to the corresponding last candle timestamp
         """
         last_timestamp_per_symbol = {}
-        for symbol in self.__symbol_timeframes:
-            last_timestamp_per_symbol[symbol] = self.__fetch_last_candle_timestamp_until_value(symbol)
+        to_fetch: list[SymbolTimeframe] = list(self.__symbol_timeframes)
+        failed_rounds: int = 0
+        while True:
+            # pairs/timeframes are independent, so they are fetched concurrently;
+            # the ones for which the exchange returned no data are fetched again on the next round
+            results = await asyncio.gather(*(self.__fetch_last_candle_timestamp(st) for st in to_fetch),
+                                           return_exceptions=True)
+            for st, timestamp in zip(to_fetch, results):
+                if isinstance(timestamp, NoDataError):
+                    continue
+                if isinstance(timestamp, BaseException):
+                    raise timestamp
+                last_timestamp_per_symbol[st] = timestamp
+            to_fetch = [st for st in to_fetch if st not in last_timestamp_per_symbol]
+
+            if len(to_fetch) == 0:
+                break
+            await asyncio.sleep(_backoff_delay(attempt=failed_rounds))
+            failed_rounds += 1
 
         return last_timestamp_per_symbol
 
-    def __fetch_last_candle_timestamp_until_value(self, to_check: SymbolTimeframe) -> int:
+    async def __fetch_last_candle_timestamp(self, to_check: SymbolTimeframe) -> int:
         """
-        Fetch last available candle timestamp for a defined pair/timeframe
+        Fetch once through REST the last available candle timestamp for a defined pair/timeframe
         :param to_check: pair/timeframe to check for
         :return: last candle timestamp
         """
-        candle = []
-        while len(candle) == 0:
-            symbol: str = to_check.get_spot_symbol()
-            timeframe: str = to_check.get_timeframe()
-            candle = self.__exchange.fetch_ohlcv(symbol=symbol, timeframe=timeframe, limit=1)
+        symbol: str = to_check.spot_symbol
+        timeframe: str = to_check.timeframe
+        candle: list = await _retry_async(lambda: self.__fast_client.fetch_ohlcv(symbol=symbol, timeframe=timeframe, limit=1))
 
         return int(candle[0][0])
 
     def __notify_listeners(self, detected: SymbolTimeframe) -> None:
         """
-        Notify subscribers that a new candle appeared for a specific pair/symbol
+        Notify subscribers that a new candle appeared for a specific pair/symbol.
+        Subscribers are called later by the dispatcher thread.
         :param detected: pair/timeframe
         """
-        for listener in self.__listeners:
-            listener.on_new_candle(detected)
+        self.__events.put(detected)
+
+    def __dispatch(self) -> None:
+        """
+        Call subscribers for each detected new candle, until the notifier ends.
+        If a subscriber fails, the notifier is stopped and the error is raised by start.
+        """
+        while True:
+            detected: SymbolTimeframe | None = self.__events.get()
+            if detected is None:
+                return
+            if not self.__must_run:
+                # stopped: remaining new candles are not notified
+                continue
+
+            try:
+                for callback in self.__callbacks:
+                    callback(detected)
+            except BaseException as error:
+                self.__dispatch_error = error
+                self.stop()
+                return
 
 
 class RealTimeBitcoinDataPrinter(NewCandleListener):
     """
     Print each minute the current BTC/USDT price, the 24h-High, the 24h-Low, the 24h-Volume,
     and the SMA calculated by using the last 30 candles on 5m timeframe (does not use current 5m candle as it is not finished yet).
+    Only 1m candles are fetched: the 24h values are computed over the last 1440 finished 1m candles,
+    and 5m candles are derived from them.
     """
 
     def __init__(self):
-        self.__btc_usdt_1d = SymbolTimeframe(spot_symbol='BTC/USDT', timeframe='1d', number_of_candle_per_update=1, must_delete_unfinished_candle=False)
-        self.__btc_usdt_5m = SymbolTimeframe(spot_symbol='BTC/USDT', timeframe='5m', number_of_candle_per_update=30, must_delete_unfinished_candle=True)
         self.__btc_usdt_1m = SymbolTimeframe(spot_symbol='BTC/USDT', timeframe='1m', number_of_candle_per_update=1, must_delete_unfinished_candle=True)
-        self.__data_per_symbol_timeframe: dict[SymbolTimeframe, pd.DataFrame] = {
-            self.__btc_usdt_1d: pd.DataFrame(),
-            self.__btc_usdt_5m: pd.DataFrame(),
-            self.__btc_usdt_1m: pd.DataFrame()
-        }
-        self.__spot_exchange: binance = ccxt.binance()
-        self.__notifier = NewCandleNotifier(exchange=self.__spot_exchange,
-                                            symbol_timeframes=list(self.__data_per_symbol_timeframe.keys()))
+        self.__symbol_timeframes: list[SymbolTimeframe] = [self.__btc_usdt_1m]
+        self.__data_per_symbol_timeframe: dict[SymbolTimeframe, Candles] = {}
+        # connections are kept alive in a pool and reused by every REST call
+        session = requests.Session()
+        session.mount('https://', requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=16))
+        self.__spot_exchange: binance = ccxt.binance({'session': session, 'enableRateLimit': True, 'timeout': 5000})
+        self.__candle_store: CandleStore = CandleStore()
+        self.__notifier = NewCandleNotifier(exchange=pro.binance({'enableRateLimit': True}),
+                                            symbol_timeframes=self.__symbol_timeframes)
         self.__notifier.register_listener(listener=self)
         self.__started: bool = False
         self.__refresh_count: int = 0
-        self.__MAX_REFRESH: int = 6
+        self.__MAX_REFRESH: int = 5
+        self.__OUTPUT_TEMPLATE: str = '[{}][current_price={};\t24h-High={};\t24h-Low={};\t24h-Volume={};\t5m-SMA(30)={}]\n'
+
+        # rolling 24h window of 1m candles, stored in preallocated ring buffers (one per column)
+        self.__ONE_MINUTE: int = 60 * 1000
+        self.__FIVE_MINUTES: int = 5 * self.__ONE_MINUTE
+        self.__ROLLING_WINDOW: int = 24 * 60 * self.__ONE_MINUTE
+        self.__ring_open_time: np.ndarray = np.zeros(24 * 60, dtype=np.int64)
+        self.__ring_open: np.ndarray = np.zeros(24 * 60, dtype=np.float64)
+        self.__ring_high: np.ndarray = np.zeros(24 * 60, dtype=np.float64)
+        self.__ring_low: np.ndarray = np.zeros(24 * 60, dtype=np.float64)
+        self.__ring_close: np.ndarray = np.zeros(24 * 60, dtype=np.float64)
+        self.__ring_volume: np.ndarray = np.zeros(24 * 60, dtype=np.float64)
+        self.__hi_queue: np.ndarray = np.zeros(24 * 60, dtype=np.int64)
+        self.__lo_queue: np.ndarray = np.zeros(24 * 60, dtype=np.int64)
+        self.__rolling_state: np.ndarray = np.zeros(6, dtype=np.int64)
+        self.__last_minute_open_time: int = 0
+        self.__high: float = float('nan')
+        self.__low: float = float('nan')
+        self.__vol_sum: float = 0.0
+
+        # closes of the last 30 finished 5m candles (derived from 1m candles), and their running sum
+        self.__sma_window: np.ndarray = np.zeros(30, dtype=np.float64)
+        self.__sma_head: int = 0
+        self.__sma_count: int = 0
+        self.__sma_sum: float = 0.0
+        self.__last_five_minute_open_time: int = 0
 
         self.__init_data()
         self.__print_formatted_output()  # the first print is immediate and does not account as part of the 5 refresh
 
-    def start(self):
+    def start(self, cpu_affinity: int | None = None):
         """
         Start print job.
+        :param cpu_affinity: CPU to which the process is pinned. Not pinned if not defined
         """
         if not self.__started:
             self.__started = True
             self.__init_data()
-            self.__notifier.start()
+            # objects allocated so far live until the end: exclude them from garbage collections
+            gc.freeze()
+            self.__notifier.start(cpu_affinity=cpu_affinity)
 
     def on_new_candle(self, symbol_timeframe: SymbolTimeframe) -> None:
         """
@@ -222,9 +792,9 @@ class RealTimeBitcoinDataPrinter(NewCandleListener):
         self.__update_data(symbol_timeframe=symbol_timeframe)
 
         if symbol_timeframe == self.__btc_usdt_1m:
-            # each minute we must fetch again current day candle
+            # the finished 1m candle enters the rolling window,
             # in order to have the 24h-high, 24h-low, and especially 24h-volume updated in real-time
-            self.__update_data(symbol_timeframe=self.__btc_usdt_1d)
+            self.__push_minute_candles(self.__data_per_symbol_timeframe[self.__btc_usdt_1m])
 
             self.__print_formatted_output()
 
@@ -241,66 +811,131 @@ class RealTimeBitcoinDataPrinter(NewCandleListener):
         """
         Fetch last available data for defined group of pair/timeframe
         """
-        for symbol_timeframe in self.__data_per_symbol_timeframe:
+        for symbol_timeframe in self.__symbol_timeframes:
             self.__update_data(symbol_timeframe=symbol_timeframe)
 
+        # fill the rolling window with the finished 1m candles of the last 24 hours
+        since: int = self.__spot_exchange.milliseconds() - self.__ROLLING_WINDOW - self.__ONE_MINUTE
+        last_day_minute_candles: Candles = ExchangeHelper.get_spot_candles_since(
+            exchange=self.__spot_exchange,
+            spot_symbol=self.__btc_usdt_1m.spot_symbol,
+            timeframe=self.__btc_usdt_1m.timeframe,
+            since=since,
+            delete_last_candle=True,
+            store=self.__candle_store)
+        self.__push_minute_candles(last_day_minute_candles)
+
+    def __push_minute_candles(self, candles: Candles) -> None:
+        """
+        Add finished 1m candles to the rolling 24h window, the ones which are older than 24 hours being ignored.
+        Each time a 1m candle ends a 5m period, the corresponding 5m candle is derived and added to the SMA window.
+        Candles that are already part of the window are ignored.
+        :param candles: finished 1m candles, sorted by open time
+        """
+        ring_size: int = len(self.__ring_open_time)
+        for candle in zip(*(column.tolist() for column in candles)):
+            open_time, open_price, high, low, close, volume = candle
+            if open_time <= self.__last_minute_open_time:
+                continue
+
+            head: int = int(self.__rolling_state[_NEXT]) % ring_size
+            self.__ring_open[head] = open_price
+            self.__ring_close[head] = close
+            self.__high, self.__low, self.__vol_sum = _update_rolling(
+                self.__ring_open_time, self.__ring_high, self.__ring_low, self.__ring_volume,
+                self.__hi_queue, self.__lo_queue, self.__rolling_state, self.__vol_sum,
+                open_time, high, low, volume, self.__ROLLING_WINDOW)
+            self.__last_minute_open_time = open_time
+
+            if (open_time + self.__ONE_MINUTE) % self.__FIVE_MINUTES == 0:
+                five_minute_open_time: int = open_time + self.__ONE_MINUTE - self.__FIVE_MINUTES
+                minute_candles: list = []
+                for index in ((head - offset) % ring_size for offset in range(4, -1, -1)):
+                    if self.__ring_open_time[index] >= five_minute_open_time:
+                        minute_candles.append((self.__ring_open_time[index], self.__ring_open[index], self.__ring_high[index],
+                                               self.__ring_low[index], self.__ring_close[index], self.__ring_volume[index]))
+                five_minute_candle: tuple = self.__aggregate(minute_candles)
+                self.__push_five_minute_candle(open_time=five_minute_open_time, close=five_minute_candle[4])
+
+    @staticmethod
+    def __aggregate(candles: list) -> tuple:
+        """
+        Aggregate contiguous candles into one candle of a higher timeframe
+        :param candles: candles (open_time, open, high, low, close, volume), sorted by open time
+        :return: the aggregated candle (open_time, open, high, low, close, volume)
+        """
+        candle: tuple = (candles[0][0], candles[0][1], max(c[2] for c in candles), min(c[3] for c in candles),
+                         candles[-1][4], sum(c[5] for c in candles))
+        _, open_price, high, low, close, volume = candle
+        assert high >= max(open_price, close, low), f'inconsistent candle: {candle}'
+        assert volume >= 0, f'negative volume: {candle}'
+
+        return candle
+
+    def __push_five_minute_candle(self, open_time: int, close: float) -> None:
+        """
+        Add the close of a finished 5m candle to the SMA window, the oldest close leaving the window.
+        Candles that are already part of the window are ignored.
+        :param open_time: open time of the 5m candle
+        :param close: close of the 5m candle
+        """
+        if open_time <= self.__last_five_minute_open_time:
+            return
+
+        self.__sma_sum, self.__sma_head = _sma_update(self.__sma_window, self.__sma_head, close, self.__sma_sum)
+        self.__sma_count = min(self.__sma_count + 1, len(self.__sma_window))
+        self.__last_five_minute_open_time = open_time
+
     def __update_data(self, symbol_timeframe: SymbolTimeframe) -> None:
         """
         Update currently stored data for a defined pair/timeframe
         :param symbol_timeframe: pair/timeframe for which we must update data
         """
-        number_of_bars: int = symbol_timeframe.get_number_of_candle_per_update()
-        must_delete_unfinished_candle: bool = symbol_timeframe.must_delete_unfinished_candle()
+        number_of_bars: int = symbol_timeframe.number_of_candle_per_update
+        must_delete_unfinished_candle: bool = symbol_timeframe.must_delete_unfinished_candle
 
         if must_delete_unfinished_candle:
             number_of_bars += 1
 
-        df: pd.DataFrame = ExchangeHelper.get_spot_dataframe(
+        candles: Candles = ExchangeHelper.get_spot_candles(
             exchange=self.__spot_exchange,
-            spot_symbol=symbol_timeframe.get_spot_symbol(),
-            timeframe=symbol_timeframe.get_timeframe(),
+            spot_symbol=symbol_timeframe.spot_symbol,
+            timeframe=symbol_timeframe.timeframe,
             number_of_candles=number_of_bars,
-            delete_last_candle=must_delete_unfinished_candle)
+            delete_last_candle=must_delete_unfinished_candle,
+            store=self.__candle_store)
 
-        self.__data_per_symbol_timeframe[symbol_timeframe] = df
+        self.__data_per_symbol_timeframe[symbol_timeframe] = candles
 
     def __print_formatted_output(self) -> None:
         """
         Print formatted output.
         """
-        current_time = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
-        print(f'[{current_time}]['
-              f'current_price={self.__current_price};\t'
-              f'24h-High={self.__high_24h};\t'
-              f'24h-Low={self.__low_24h};\t'
-              f'24h-Volume={self.__volume_24h};\t'
-              f'5m-SMA(30)={self.__five_minute_sma}'
-              f']')
+        current_time = time.strftime("%d/%m/%Y %H:%M:%S")
+        sys.stdout.write(self.__OUTPUT_TEMPLATE.format(current_time, self.__current_price, self.__high_24h,
+                                                       self.__low_24h, self.__volume_24h, self.__five_minute_sma))
+        sys.stdout.flush()
 
     @property
-    def __current_price(self):
-        btc_last_minute_candle: pd.DataFrame = self.__data_per_symbol_timeframe[self.__btc_usdt_1m]
-        return btc_last_minute_candle['close'].iloc[0]
+    def __current_price(self) -> float:
+        btc_last_minute_candle: Candles = self.__data_per_symbol_timeframe[self.__btc_usdt_1m]
+        return btc_last_minute_candle.close[0]
 
     @property
-    def __high_24h(self) -> int:
-        btc_current_day_candle: pd.DataFrame = self.__data_per_symbol_timeframe[self.__btc_usdt_1d]
-        return btc_current_day_candle['high'].iloc[0]
+    def __high_24h(self) -> float:
+        return self.__high
 
     @property
-    def __low_24h(self) -> int:
-        btc_current_day_candle: pd.DataFrame = self.__data_per_symbol_timeframe[self.__btc_usdt_1d]
-        return btc_current_day_candle['low'].iloc[0]
+    def __low_24h(self) -> float:
+        return self.__low
 
     @property
-    def __volume_24h(self) -> int:
-        btc_current_day_candle: pd.DataFrame = self.__data_per_symbol_timeframe[self.__btc_usdt_1d]
-        return btc_current_day_candle['volume'].iloc[0]
+    def __volume_24h(self) -> float:
+        return self.__vol_sum
 
     @property
     def __five_minute_sma(self) -> float:
-        btc_last_30_candles_on_5m_tf: pd.DataFrame = self.__data_per_symbol_timeframe[self.__btc_usdt_5m]
-        return btc_last_30_candles_on_5m_tf['close'].mean()
+        return self.__sma_sum / self.__sma_count
 
 
 def main():